@@ -2,8 +2,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-import ollama
-
 DEFAULT_MODEL = "llama3.1:8b"
 
 
@@ -17,6 +15,9 @@ class HermesLLMClient:
         return path.read_text(encoding="utf-8")
 
     def analyze_market(self, market_snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        # Imported on first use so startup doesn't pay for the HTTP client stack
+        import ollama
+
         payload = {
             "model": self.model,
             "prompt": self._build_prompt(market_snapshot),
@@ -6,6 +6,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
 from telegram import Bot
+from telegram.request import HTTPXRequest
 
 
 from hermes.providers.binance import Binance, BinanceMarketData
@@ -49,7 +50,7 @@ def main() -> None:
             try:
                 run_performance_window_job(window_minutes=60)
             except Exception as e:
-                logger.warning("Performance job loop failed: %s", e)
+                logger.warning("Performance job loop failed: {}", e)
             time.sleep(60 * 60)
 
     threading.Thread(target=_performance_loop, daemon=True).start()
@@ -77,7 +78,18 @@ def main() -> None:
     )
     market_data = BinanceMarketData()
 
-    telegram_bot = Bot(token=telegram_token)
+    # Keep-alive connections, used only from the notifier's own loop. At most
+    # one queued send is in flight, plus the odd prompt, dashboard edit or
+    # file upload, so a small pool is enough.
+    telegram_bot = Bot(
+        token=telegram_token,
+        request=HTTPXRequest(
+            connection_pool_size=4,
+            connect_timeout=2.0,
+            read_timeout=5.0,
+            pool_timeout=5.0,
+        ),
+    )
 
     notifier = TelegramNotifier(
         bot=telegram_bot,
@@ -112,6 +124,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.warning("CTRL+C received. Stopping all bots...")
         bot_service.stop_all()
+        notifier.close()
 
 
 
@@ -5,7 +5,6 @@ from datetime import time as dt_time
 from pathlib import Path
 import html
 import time
-from zoneinfo import ZoneInfo
 
 from loguru import logger
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -22,10 +21,11 @@ from telegram.ext import (
 from telegram.error import BadRequest, RetryAfter, TimedOut, NetworkError
 import asyncio
 
-from hermes.service.bot_builder import BotBuilder
+from hermes.service.bot_builder import make_bot_config
 from hermes.service.bot_service import BotService
 from hermes.service.bot_state import BotRuntimeState
 from hermes.utils.trading_mode import TradingMode
+from hermes.utils.time import BOGOTA_TZ
 from hermes.utils.report_writer import write_bot_report
 
 
@@ -122,11 +122,11 @@ class Controller:
             )
             app.job_queue.run_daily(
                 self._send_daily_summary,
-                time=dt_time(hour=18, minute=0, tzinfo=ZoneInfo("America/Bogota")),
+                time=dt_time(hour=18, minute=0, tzinfo=BOGOTA_TZ),
             )
             app.job_queue.run_daily(
                 self._send_daily_summary,
-                time=dt_time(hour=6, minute=0, tzinfo=ZoneInfo("America/Bogota")),
+                time=dt_time(hour=6, minute=0, tzinfo=BOGOTA_TZ),
             )
 
         else:
@@ -153,12 +153,12 @@ class Controller:
         err = context.error
         if err is None:
             logger.warning(
-                "Telegram error handler invoked without exception | update=%s",
+                "Telegram error handler invoked without exception | update={}",
                 update,
             )
             return
         if isinstance(err, (TimedOut, NetworkError)):
-            logger.warning("Telegram network error: %s", err)
+            logger.warning("Telegram network error: {}", err)
             return
         logger.opt(exception=err).error("Unhandled Telegram error")
 
@@ -206,7 +206,7 @@ class Controller:
         return text, keyboard
 
     def _build_running_bots_text(self) -> str:
-        states = self.bot_service.get_all_states()
+        states = self.bot_service.get_all_snapshots()
 
         if not states:
             return "🤷 <b>No bots running</b>"
@@ -242,7 +242,7 @@ class Controller:
 
     def _build_running_bots_keyboard(self) -> list[list[InlineKeyboardButton]]:
         rows: list[list[InlineKeyboardButton]] = []
-        for state in self.bot_service.get_all_states():
+        for state in self.bot_service.get_all_snapshots():
             rows.append(
                 [InlineKeyboardButton(f"📊 {state.symbol}", callback_data=f"dash_open:{state.symbol}")]
             )
@@ -312,7 +312,7 @@ class Controller:
         else:
             normalized_expectancy = 1.0 if expectancy > 0 else 0.0
 
-        recent_pnls = state.recent_pnls[-10:]
+        recent_pnls = list(state.recent_pnls)
         recent_sum = sum(recent_pnls) if recent_pnls else 0.0
         denom = (avg_loss if avg_loss > 0 else 1.0) * max(len(recent_pnls), 1)
         ratio = max(min(recent_sum / denom, 1.0), -1.0)
@@ -627,7 +627,7 @@ class Controller:
             return
 
         if action == "manage_menu":
-            states = self.bot_service.get_all_states()
+            states = self.bot_service.get_all_snapshots()
             if not states:
                 await self._render(
                     query=query,
@@ -680,13 +680,7 @@ class Controller:
                 await query.answer("No config found", show_alert=True)
                 return
 
-            config = (
-                BotBuilder()
-                .with_symbol(state.symbol, state.base_asset)
-                .with_profile(state.profile)
-                .with_defaults()
-                .build()
-            )
+            config = make_bot_config(state.symbol, state.base_asset, state.profile)
             config = replace(
                 config,
                 bot_id=state.config.bot_id,
@@ -910,13 +904,7 @@ class Controller:
                 await query.answer("No pending config", show_alert=True)
                 return
 
-            config = (
-                BotBuilder()
-                .with_symbol(symbol, base_asset)
-                .with_profile(pending["profile"])
-                .with_defaults()
-                .build()
-            )
+            config = make_bot_config(symbol, base_asset, pending["profile"])
 
             pending.update({"symbol": symbol, "base_asset": base_asset, "config": config, "step": "ready"})
             await self._show_config(query=query, pending=pending)
@@ -1135,7 +1123,7 @@ class Controller:
             return
 
         if action.startswith("stop_sell_execute:"):
-            symbol = action.split(":", 1)[1]
+            symbol = action.split(":", 1)[1].upper()
             state = self.bot_service.get_bot_state(symbol)
             wait_seconds = self._profile_ttl(state.profile if state else None, default=3)
 
@@ -1156,7 +1144,7 @@ class Controller:
                 try:
                     order = self.bot_service.binance.safe_sell_all(symbol)
                 except Exception as e:
-                    logger.warning("Stop & Sell failed: %s", e)
+                    logger.warning("Stop & Sell failed: {}", e)
 
             try:
                 self.bot_service.stop_bot(symbol)
@@ -1213,13 +1201,13 @@ class Controller:
 
         if action.startswith("report_menu:"):
             symbol = action.split(":", 1)[1]
-            state = self.bot_service.get_bot_state(symbol)
+            state = self.bot_service.get_bot_snapshot(symbol)
             if not state:
                 await query.answer("No state found", show_alert=True)
                 return
 
             await query.answer("Generating report...")
-            file_path = write_bot_report(state)
+            file_path = await asyncio.wrap_future(write_bot_report(state))
             notifier = self.bot_service.get_any_notifier()
             await notifier.send_file(file_path, caption=f"📊 Report for {symbol}")
 
@@ -1903,13 +1891,7 @@ class Controller:
 
             symbol, base_asset = parts
 
-            config = (
-                BotBuilder()
-                .with_symbol(symbol, base_asset)
-                .with_profile(pending["profile"])
-                .with_defaults()
-                .build()
-            )
+            config = make_bot_config(symbol, base_asset, pending["profile"])
 
             pending.update(
                 {
@@ -1963,8 +1945,14 @@ class Controller:
 
 
     async def _auto_refresh_dashboards(self, context):
-        for state in self.bot_service.get_all_states():
-            if not state.running:
+        for snapshot in self.bot_service.get_all_snapshots():
+            if not snapshot.running:
+                continue
+
+            # Render the published snapshot; the live state only holds the
+            # dashboard bookkeeping
+            state = self.bot_service.get_bot_state(snapshot.symbol)
+            if state is None:
                 continue
 
             # 🔒 NO refrescar si el bot aún no tiene dashboard
@@ -1973,13 +1961,13 @@ class Controller:
 
             notifier = self.bot_service.get_notifier(state.symbol)
             try:
-                await notifier.render_bot_dashboard(state)
+                await notifier.render_bot_dashboard(state, view=snapshot)
             except Exception as e:
-                logger.warning("Dashboard refresh skipped: %s", e)
+                logger.warning("Dashboard refresh skipped: {}", e)
                 continue
 
     async def _send_daily_summary(self, context):
-        states = self.bot_service.get_all_states()
+        states = self.bot_service.get_all_snapshots()
         if not states:
             return
 
@@ -2127,7 +2115,7 @@ class Controller:
         )
 
     def _resolve_bot_id(self, args: list[str], *, usage: str) -> tuple[str | None, str | None]:
-        states = self.bot_service.get_all_states()
+        states = self.bot_service.get_all_snapshots()
         if not states:
             return None, "🤷 <b>No bots running</b>"
 
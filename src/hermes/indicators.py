@@ -0,0 +1,55 @@
+# src/indicators.py
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python/NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def vortex_kernel(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    n_atr: int = 14,
+    n_vel: int = 5,
+) -> tuple[float, float]:
+    """
+    Return (price, score) where score = velocity / ATR, in a single pass.
+    """
+    size = closes.shape[0]
+    if size == 0:
+        return 0.0, 0.0
+
+    price = closes[size - 1]
+
+    velocity = 0.0
+    if size >= n_vel + 1:
+        velocity = (price - closes[size - 1 - n_vel]) / n_vel
+
+    atr = 0.0
+    if size >= n_atr + 1:
+        total = 0.0
+        for i in range(size - n_atr, size):
+            prev_close = closes[i - 1]
+            high = highs[i] if highs[i] > prev_close else prev_close
+            low = lows[i] if lows[i] < prev_close else prev_close
+            total += high - low
+        atr = total / n_atr
+
+    score = velocity / atr if atr > 0 else 0.0
+    return price, score
+
+
+def _warmup() -> None:
+    # Compile on import (column views match the OHLCV layout used by the bot)
+    # so the first trade cycle doesn't pay the JIT cost.
+    dummy = np.ones((32, 5), dtype=np.float64)
+    vortex_kernel(dummy[:, 1], dummy[:, 2], dummy[:, 3])
+
+
+_warmup()
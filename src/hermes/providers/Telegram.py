@@ -3,6 +3,7 @@ import hashlib
 import os
 import threading
 import time
+from concurrent.futures import Future
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
 from telegram.error import BadRequest, TimedOut, NetworkError
@@ -14,6 +15,9 @@ AI_SNAPSHOT_WINDOW_SECONDS = 60 * 60
 
 QUIET_ACTIONS = {"WAIT_SIGNAL", "ARM_INIT", "WAIT_CONFIRMATION", "WAITING_CONFIRMATION"}
 MIN_EDIT_INTERVAL_SECONDS = 30
+SEND_QUEUE_MAXSIZE = 1024
+SEND_THROTTLE_SECONDS = 1.0
+SYNC_SEND_TIMEOUT_SECONDS = 10.0
 
 
 class TelegramNotifier:
@@ -22,15 +26,44 @@ class TelegramNotifier:
         self.chat_id = chat_id
         self._editing = set()
 
+        # `bot` (and the httpx client behind it) is only ever used on this
+        # loop. Every call, sync or async, from any thread, is scheduled here.
+        self._loop = asyncio.new_event_loop()
+        self._send_lock = asyncio.Lock()
+        self._pending = threading.BoundedSemaphore(SEND_QUEUE_MAXSIZE)
+        self._worker = threading.Thread(
+            target=self._run_loop,
+            name="telegram-notifier",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _on_owner_loop(self, coro):
+        # For callers awaiting from another loop (the controller's Application)
+        return await asyncio.wrap_future(self._submit(coro))
+
     # =========================
     # Dashboard renderer
     # =========================
-    async def render_bot_dashboard(self, state, force: bool = False):
+    async def render_bot_dashboard(self, state, force: bool = False, view=None):
+        """
+        Render the dashboard for `view` (a published snapshot; defaults to
+        `state`). Message id and edit bookkeeping are kept on the live `state`.
+        """
         if os.getenv("TELEGRAM_DEV_MODE") == "true":
             return
+        await self._on_owner_loop(self._render_bot_dashboard(state, force, view or state))
 
-        text = self._build_text(state)
-        keyboard = self._build_keyboard(state)
+    async def _render_bot_dashboard(self, state, force: bool, view):
+        text = self._build_text(view)
+        keyboard = self._build_keyboard(view)
 
         payload = text + repr(keyboard)
         payload_hash = hashlib.sha256(payload.encode()).hexdigest()
@@ -48,11 +81,11 @@ class TelegramNotifier:
             state.telegram_message_id = msg.message_id
             state.last_dashboard_hash = payload_hash
             state.last_dashboard_update = now
-            logger.info("📊 Dashboard created | symbol=%s", state.symbol)
+            logger.info("📊 Dashboard created | symbol={}", view.symbol)
             return
 
         if not force:
-            if state.last_action in QUIET_ACTIONS:
+            if view.last_action in QUIET_ACTIONS:
                 return
 
             if (
@@ -331,6 +364,9 @@ class TelegramNotifier:
     # Send file helper
     # =========================
     async def send_file(self, file_path: str, caption: str = ""):
+        await self._on_owner_loop(self._send_file(file_path, caption))
+
+    async def _send_file(self, file_path: str, caption: str):
         with open(file_path, "rb") as f:
             await self.bot.send_document(
                 chat_id=self.chat_id,
@@ -351,20 +387,10 @@ class TelegramNotifier:
         if os.getenv("TELEGRAM_DEV_MODE") == "true":
             return None
 
-        msg = await self.bot.send_message(
-            chat_id=self.chat_id,
-            text=text,
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
-            disable_notification=silent,
-            reply_markup=reply_markup,
+        return await self._on_owner_loop(
+            self._send_message(text, delete_after, silent, reply_markup)
         )
 
-        if delete_after and delete_after > 0:
-            asyncio.create_task(self._auto_delete(msg.message_id, delete_after))
-
-        return msg
-
     def send_ephemeral_sync(
         self,
         text: str,
@@ -372,47 +398,83 @@ class TelegramNotifier:
         silent: bool = False,
         reply_markup=None,
     ) -> int | None:
+        """
+        Send from a non-async thread and wait for the message id.
+        """
         if os.getenv("TELEGRAM_DEV_MODE") == "true":
             return
 
-        async def _send_message():
-            return await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=text,
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True,
-                disable_notification=silent,
-                reply_markup=reply_markup,
-            )
-
+        future = self._submit(self._send_message(text, delete_after, silent, reply_markup))
         try:
-            msg = asyncio.run(_send_message())
+            msg = future.result(timeout=SYNC_SEND_TIMEOUT_SECONDS)
         except Exception as e:
-            logger.warning("Ephemeral send failed: %s", e)
+            future.cancel()
+            logger.warning("Ephemeral send failed: {}", e)
             return
 
-        if not delete_after or delete_after <= 0:
-            return msg.message_id
+        return msg.message_id
 
-        def _delete():
-            async def _delete_message():
-                try:
-                    await self.bot.delete_message(
-                        chat_id=self.chat_id,
-                        message_id=msg.message_id,
-                    )
-                except Exception:
-                    pass
+    def send_ephemeral_nowait(
+        self,
+        text: str,
+        delete_after: int = 5,
+        silent: bool = False,
+        reply_markup=None,
+    ) -> None:
+        """
+        Queue a message for the notifier loop and return immediately.
+        Messages are dropped (and logged) if too many are already pending.
+        """
+        if os.getenv("TELEGRAM_DEV_MODE") == "true":
+            return
+
+        if not self._pending.acquire(blocking=False):
+            logger.warning("Telegram send queue full, dropping message")
+            return
+
+        future = self._submit(self._send_queued(text, delete_after, silent, reply_markup))
+        future.add_done_callback(lambda _: self._pending.release())
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the notifier loop after the queued messages are sent.
+        """
+        try:
+            self._submit(self._drain()).result(timeout=timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._worker.join(timeout=timeout)
+
+    async def _send_message(self, text: str, delete_after: int, silent: bool, reply_markup):
+        msg = await self.bot.send_message(
+            chat_id=self.chat_id,
+            text=text,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True,
+            disable_notification=silent,
+            reply_markup=reply_markup,
+        )
+
+        if delete_after and delete_after > 0:
+            asyncio.create_task(self._auto_delete(msg.message_id, delete_after))
+
+        return msg
 
+    async def _send_queued(self, text: str, delete_after: int, silent: bool, reply_markup):
+        # The lock is FIFO: queued messages go out in order, one per throttle window
+        async with self._send_lock:
             try:
-                asyncio.run(_delete_message())
-            except Exception:
-                pass
+                await self._send_message(text, delete_after, silent, reply_markup)
+            except Exception as e:
+                logger.warning("Queued Telegram send failed: {}", e)
+                return
+            await asyncio.sleep(SEND_THROTTLE_SECONDS)
 
-        timer = threading.Timer(delete_after, _delete)
-        timer.daemon = True
-        timer.start()
-        return msg.message_id
+    async def _drain(self) -> None:
+        # Acquired only after every send queued before it has finished
+        async with self._send_lock:
+            pass
 
     async def _auto_delete(self, message_id: int, delay: int):
         await asyncio.sleep(delay)
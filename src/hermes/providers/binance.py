@@ -1,17 +1,115 @@
+from binance import ThreadedWebsocketManager
 from binance.client import Client
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN
+from functools import partial
 from loguru import logger
+import numpy as np
+import threading
 import time
 from typing import Optional, Callable, Any
 
+from hermes.providers.market_data import MarketData
+
+
+def _closes_arr(klines: list) -> np.ndarray:
+    """
+    Close prices (kline column 4) as a float64 array.
+    """
+    return np.fromiter((k[4] for k in klines), dtype=np.float64, count=len(klines))
+
+
+def _floor_to_step(value: Decimal, step: Decimal) -> Decimal:
+    """
+    Round value down to a multiple of step (step must be normalized).
+    """
+    if step.as_tuple().digits == (1,):
+        # Power-of-ten step: quantize to its exponent directly
+        return value.quantize(step, rounding=ROUND_DOWN)
+    return (value / step).to_integral_value(rounding=ROUND_DOWN) * step
+
+
+class _Throttle:
+    """
+    Rate limit for chatty log lines: ok() is True at most once per interval.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.last = float("-inf")
+
+    def ok(self) -> bool:
+        now = time.monotonic()
+        if now - self.last < self.min_interval:
+            return False
+        self.last = now
+        return True
+
+
+@dataclass(frozen=True)
+class SymbolMeta:
+    """
+    Exchange metadata for one symbol, parsed once when first cached.
+    """
+    base_asset: str
+    filters: dict[str, dict]
+    step: Decimal | None
+    tick: Decimal | None
+    min_notional: float
+
+    @classmethod
+    def from_info(cls, info: dict) -> "SymbolMeta":
+        filters = {f.get("filterType"): f for f in info.get("filters", [])}
+
+        lot_size = filters.get("LOT_SIZE")
+        price_filter = filters.get("PRICE_FILTER")
+        notional = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL")
+
+        if notional is None:
+            # Some symbols may not return it in spot filters; keep safe fallback.
+            logger.warning(
+                f"No NOTIONAL/MIN_NOTIONAL filter found for {info.get('symbol')}. Using 0.0 fallback."
+            )
+
+        return cls(
+            base_asset=info["baseAsset"],
+            filters=filters,
+            # Normalized so "0.00100000" carries exponent -3, not -8
+            step=Decimal(lot_size["stepSize"]).normalize() if lot_size else None,
+            tick=Decimal(price_filter["tickSize"]).normalize() if price_filter else None,
+            min_notional=float(notional.get("minNotional", 0.0)) if notional else 0.0,
+        )
+
 
 class Binance:
     MIN_TRADE_USDT = 7.0
+    BALANCE_TTL_SECONDS = 0.5
 
     def __init__(self, api_key: str, api_secret: str):
         logger.debug("Initializing Binance client")
         self._client = Client(api_key, api_secret)
-        self._symbol_info_cache: dict[str, dict] = {}
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._symbol_info_cache: dict[str, SymbolMeta] = {}
+        self._exchange_symbols: dict[str, dict] = {}
+        self._balances: dict[str, float] = {}
+        self._balances_ts = float("-inf")
+        # Bumped by every balance-moving call; a refresh that raced one is discarded
+        self._balances_gen = 0
+        # (symbol, interval) -> (last candle's close time in ms, open times, closes)
+        self._closes_cache: dict[tuple[str, str], tuple[int, np.ndarray, np.ndarray]] = {}
+
+        # Populated by WebSocket callbacks while a trailing stop is running
+        self._last_price: dict[str, float] = {}
+        # Monotonic time of the last book ticker message, size-only ones included
+        self._price_ts: dict[str, float] = {}
+        self._free_balance: dict[str, float] = {}
+        # Monotonic time each free balance was last confirmed by the stream or REST
+        self._balance_ts: dict[str, float] = {}
+        self._tick_events: dict[str, threading.Event] = {}
+        # Assets whose balance is currently kept fresh by a live user stream
+        self._streamed_assets: set[str] = set()
+        self._overext_log: dict[str, _Throttle] = {}
 
     # =========================
     # Low-level helpers
@@ -20,34 +118,58 @@ class Binance:
     def _get_account(self) -> dict:
         return self._client.get_account()
 
-    def _get_symbol_info(self, symbol: str) -> dict:
-        symbol = symbol.upper()
-        if symbol not in self._symbol_info_cache:
-            self._symbol_info_cache[symbol] = self._client.get_symbol_info(symbol)
-        return self._symbol_info_cache[symbol]
+    def _create_order(self, **params) -> dict:
+        order = self._client.create_order(**params)
+        self._invalidate_balances()
+        return order
 
-    def _get_filter(self, symbol: str, filter_type: str) -> dict:
-        info = self._get_symbol_info(symbol)
-        for f in info.get("filters", []):
-            if f.get("filterType") == filter_type:
-                return f
-        raise ValueError(f"Filter {filter_type} not found for {symbol}")
+    def _invalidate_balances(self) -> None:
+        # Balances moved; the next read must go back to the account endpoint
+        self._balances_gen += 1
+        self._balances_ts = float("-inf")
+
+    def _prime_cache(self) -> None:
+        """
+        Fetch every symbol's raw info in a single exchangeInfo call.
+        """
+        info = self._client.get_exchange_info()
+        self._exchange_symbols = {s["symbol"]: s for s in info["symbols"]}
+
+    def _get_symbol_info(self, symbol: str) -> SymbolMeta:
+        # Symbols arrive pre-normalized from BotConfig
+        meta = self._symbol_info_cache.get(symbol)
+        if meta is None:
+            if not self._exchange_symbols:
+                self._prime_cache()
+            raw = self._exchange_symbols.get(symbol)
+            if raw is None:
+                # Listed after the bundle was fetched
+                raw = self._client.get_symbol_info(symbol)
+                if raw is None:
+                    raise ValueError(f"Unknown symbol: {symbol}")
+            meta = SymbolMeta.from_info(raw)
+            self._symbol_info_cache[symbol] = meta
+        return meta
 
     def _get_base_asset(self, symbol: str) -> str:
-        info = self._get_symbol_info(symbol)
-        return info["baseAsset"]
+        return self._get_symbol_info(symbol).base_asset
 
     # =========================
     # Balances / Prices
     # =========================
 
     def get_asset_free(self, asset: str) -> float:
-        asset = asset.upper()
-        account = self._get_account()
-        for b in account["balances"]:
-            if b["asset"] == asset:
-                return float(b["free"])
-        return 0.0
+        now = time.monotonic()
+        if now - self._balances_ts > self.BALANCE_TTL_SECONDS:
+            gen = self._balances_gen
+            account = self._get_account()
+            balances = {b["asset"]: float(b["free"]) for b in account["balances"]}
+            if gen != self._balances_gen:
+                # An order landed mid-fetch; don't cache what may predate it
+                return balances.get(asset, 0.0)
+            self._balances = balances
+            self._balances_ts = now
+        return self._balances.get(asset, 0.0)
 
     def get_usdt_free(self) -> float:
         logger.info("Fetching USDT free balance")
@@ -68,13 +190,138 @@ class Binance:
         return bnb
 
     def get_price(self, symbol: str) -> float:
-        symbol = symbol.upper()
         return float(self._client.get_symbol_ticker(symbol=symbol)["price"])
 
     def get_klines(self, symbol: str, interval: str, limit: int = 50) -> list:
-        symbol = symbol.upper()
         return self._client.get_klines(symbol=symbol, interval=interval, limit=limit)
 
+    # =========================
+    # Streams (trailing stop)
+    # =========================
+
+    def _start_trailing_streams(
+        self, symbol: str, base_asset: str
+    ) -> ThreadedWebsocketManager | None:
+        """
+        Subscribe to the symbol book ticker and the user-data stream so the
+        trailing loop can read price/balance locally and wake on every tick.
+        Returns None if streams can't start; readers then fall back to REST.
+        """
+        self._last_price.pop(symbol, None)
+        self._price_ts.pop(symbol, None)
+        self._free_balance.pop(base_asset, None)
+        self._balance_ts.pop(base_asset, None)
+        self._tick_events.setdefault(symbol, threading.Event()).clear()
+
+        twm = None
+        try:
+            twm = ThreadedWebsocketManager(
+                api_key=self._api_key,
+                api_secret=self._api_secret,
+            )
+            twm.start()
+            twm.start_symbol_book_ticker_socket(
+                # Error messages don't name the symbol; bind it here
+                callback=partial(self._on_book_ticker, symbol),
+                symbol=symbol,
+            )
+            twm.start_user_socket(callback=self._on_user_event)
+        except Exception as e:
+            logger.warning(f"TRAILING STREAMS unavailable, polling REST: {e}")
+            if twm is not None:
+                # Started but not subscribed: nothing else will stop it
+                try:
+                    twm.stop()
+                except Exception:
+                    pass
+            self._tick_events.pop(symbol, None)
+            return None
+
+        self._streamed_assets.add(base_asset)
+        return twm
+
+    def _on_book_ticker(self, symbol: str, msg: dict) -> None:
+        if msg.get("e") == "error":
+            # python-binance gave up reconnecting; readers must go back to REST
+            logger.warning(f"BOOK TICKER stream error | {symbol} | {msg.get('m')}")
+            self._last_price.pop(symbol, None)
+            self._price_ts.pop(symbol, None)
+            event = self._tick_events.get(symbol)
+            if event is not None:
+                event.set()
+            return
+        if "b" not in msg:
+            return
+        self._price_ts[symbol] = time.monotonic()
+        # Best bid: the price a market sell would fill at
+        bid = float(msg["b"])
+        if self._last_price.get(symbol) == bid:
+            # Size-only update; nothing for the trailing loop to re-check
+            return
+        self._last_price[symbol] = bid
+        event = self._tick_events.get(symbol)
+        if event is not None:
+            event.set()
+
+    def _on_user_event(self, msg: dict) -> None:
+        if msg.get("e") == "error":
+            # The stream is gone; drop what it was keeping fresh
+            logger.warning(f"USER stream error | {msg.get('m')}")
+            for asset in tuple(self._streamed_assets):
+                self._free_balance.pop(asset, None)
+                self._balance_ts.pop(asset, None)
+            return
+        if msg.get("e") != "outboundAccountPosition":
+            return
+        now = time.monotonic()
+        for b in msg.get("B", []):
+            self._free_balance[b["a"]] = float(b["f"])
+            self._balance_ts[b["a"]] = now
+
+    def _streamed_price(self, symbol: str, max_age: float) -> float:
+        price = self._last_price.get(symbol)
+        age = time.monotonic() - self._price_ts.get(symbol, float("-inf"))
+        if price is None or age > max_age:
+            # No stream, or one that has gone quiet: don't trail a frozen bid
+            return self.get_price(symbol)
+        return price
+
+    def _wait_tick(self, symbol: str, timeout: float) -> None:
+        """
+        Block until the next streamed price for symbol, or timeout seconds.
+        Without a stream this is a plain sleep.
+        """
+        event = self._tick_events.get(symbol)
+        if event is None:
+            time.sleep(timeout)
+            return
+        event.wait(timeout)
+        event.clear()
+
+    def _streamed_asset_free(self, asset: str, max_age: float) -> float:
+        if asset not in self._streamed_assets:
+            # No live user stream: nothing would keep a local copy fresh
+            return self.get_asset_free(asset)
+        free = self._free_balance.get(asset)
+        if free is None or time.monotonic() - self._balance_ts.get(asset, float("-inf")) > max_age:
+            # Seed from REST, and re-check it once the stream has been quiet for
+            # max_age: it only reports changes, and can die without a word
+            fetched_at = time.monotonic()
+            free = self.get_asset_free(asset)
+            if self._balance_ts.get(asset, float("-inf")) < fetched_at:
+                # Unless a stream update landed meanwhile; it is newer than REST
+                self._free_balance[asset] = free
+                self._balance_ts[asset] = fetched_at
+            free = self._free_balance.get(asset, free)
+        return free
+
+    def _trailing_exit_sell(self, symbol: str, base_asset: str) -> dict | None:
+        try:
+            return self.safe_sell_all(symbol)
+        finally:
+            # Filled, failed or skipped: re-read the balance from REST next time
+            self._free_balance.pop(base_asset, None)
+
     # =========================
     # Exchange adjustments
     # =========================
@@ -83,44 +330,27 @@ class Binance:
         """
         Adjust quantity to LOT_SIZE stepSize using Decimal to avoid float issues.
         """
-        symbol = symbol.upper()
-        lot_size = self._get_filter(symbol, "LOT_SIZE")
+        step = self._get_symbol_info(symbol).step
+        if step is None:
+            raise ValueError(f"Filter LOT_SIZE not found for {symbol}")
 
-        step = Decimal(lot_size["stepSize"])
-        q = Decimal(str(qty))
-
-        adjusted = (q / step).to_integral_value(rounding=ROUND_DOWN) * step
-        return float(adjusted)
+        return float(_floor_to_step(Decimal(str(qty)), step))
 
     def _adjust_price(self, symbol: str, price: float) -> float:
         """
         Adjust price to PRICE_FILTER tickSize (required for STOP_LOSS_LIMIT and LIMIT orders).
         """
-        symbol = symbol.upper()
-        pf = self._get_filter(symbol, "PRICE_FILTER")
-
-        tick = Decimal(pf["tickSize"])
-        p = Decimal(str(price))
+        tick = self._get_symbol_info(symbol).tick
+        if tick is None:
+            raise ValueError(f"Filter PRICE_FILTER not found for {symbol}")
 
-        adjusted = (p / tick).to_integral_value(rounding=ROUND_DOWN) * tick
-        return float(adjusted)
+        return float(_floor_to_step(Decimal(str(price)), tick))
 
     def _get_min_notional(self, symbol: str) -> float:
         """
         Return exchange min notional if present (NOTIONAL or MIN_NOTIONAL filters).
         """
-        symbol = symbol.upper()
-        info = self._get_symbol_info(symbol)
-
-        for f in info.get("filters", []):
-            if f.get("filterType") in ("NOTIONAL", "MIN_NOTIONAL"):
-                return float(f.get("minNotional", 0.0))
-
-        # Some symbols may not return it in spot filters; keep safe fallback.
-        logger.warning(
-            f"No NOTIONAL/MIN_NOTIONAL filter found for {symbol}. Using 0.0 fallback."
-        )
-        return 0.0
+        return self._get_symbol_info(symbol).min_notional
 
     # =========================
     # Trade validation
@@ -131,9 +361,8 @@ class Binance:
         symbol: str,
         qty: float,
         enforce_user_min: bool = False,
+        price: Optional[float] = None,
     ) -> tuple[bool, str]:
-        symbol = symbol.upper()
-
         if qty <= 0:
             return False, "Quantity must be greater than zero"
 
@@ -141,7 +370,8 @@ class Binance:
         if adjusted_qty <= 0:
             return False, "Quantity too small after LOT_SIZE adjustment"
 
-        price = float(self._client.get_symbol_ticker(symbol=symbol)["price"])
+        if price is None:
+            price = float(self._client.get_symbol_ticker(symbol=symbol)["price"])
         notional = adjusted_qty * price
 
         min_exchange = self._get_min_notional(symbol)
@@ -162,19 +392,20 @@ class Binance:
         qty: float,
         context: str,
         ignore_min_trade: bool = False,
+        price: Optional[float] = None,
     ) -> str:
         """
         Validate, adjust and format quantity for trading.
 
         - ignore_min_trade=True  -> only Binance rules (LOT_SIZE + NOTIONAL)
         - ignore_min_trade=False -> Binance rules + user MIN_TRADE_USDT
+        - price: already-known price; fetched from the ticker when omitted
         """
-        symbol = symbol.upper()
-
         ok, reason = self.can_trade(
             symbol,
             qty,
             enforce_user_min=not ignore_min_trade,
+            price=price,
         )
         if not ok:
             raise ValueError(f"{context} skipped: {reason}")
@@ -196,7 +427,6 @@ class Binance:
         Buy crypto using USDT at market price.
         Uses quoteOrderQty so it spends up to `usdt`.
         """
-        symbol = symbol.upper()
         if usdt < self.MIN_TRADE_USDT:
             raise ValueError(
                 f"USDT amount too small ({usdt}). Minimum is {self.MIN_TRADE_USDT} USDT."
@@ -204,7 +434,7 @@ class Binance:
 
         logger.info(f"BUY | symbol={symbol} | usdt={usdt}")
 
-        order = self._client.create_order(
+        order = self._create_order(
             symbol=symbol,
             side="BUY",
             type="MARKET",
@@ -222,7 +452,6 @@ class Binance:
         """
         Sell enough base asset to receive approximately `usdt` (market).
         """
-        symbol = symbol.upper()
         logger.info(f"SELL FOR USDT | symbol={symbol} | target_usdt={usdt}")
 
         price = self.get_price(symbol)
@@ -237,7 +466,7 @@ class Binance:
 
         logger.info(f"SELL | symbol={symbol} | qty={qty_str}")
 
-        order = self._client.create_order(
+        order = self._create_order(
             symbol=symbol,
             side="SELL",
             type="MARKET",
@@ -255,7 +484,6 @@ class Binance:
         Sell ALL free base asset balance (market).
         Uses only Binance exchange rules (LOT_SIZE + NOTIONAL).
         """
-        symbol = symbol.upper()
         base_asset = self._get_base_asset(symbol)
 
         # 1. Get real free balance (auto-sync with app trades)
@@ -274,7 +502,7 @@ class Binance:
         logger.info(f"SELL ALL | symbol={symbol} | qty={qty_str}")
 
         # 3. Market sell
-        order = self._client.create_order(
+        order = self._create_order(
             symbol=symbol,
             side="SELL",
             type="MARKET",
@@ -308,7 +536,6 @@ class Binance:
         Prices are adjusted to tickSize.
         Uses ONLY Binance exchange rules (not MIN_TRADE_USDT).
         """
-        symbol = symbol.upper()
         base_asset = self._get_base_asset(symbol)
 
         # 1. Get real free balance (auto-syncs with manual app trades)
@@ -334,7 +561,7 @@ class Binance:
         )
 
         # 4. Place STOP_LOSS_LIMIT order
-        order = self._client.create_order(
+        order = self._create_order(
             symbol=symbol,
             side="SELL",
             type="STOP_LOSS_LIMIT",
@@ -361,7 +588,6 @@ class Binance:
         Adjusts prices to tickSize.
         Returns order dict if placed, else None.
         """
-        symbol = symbol.upper()
         base_asset = self._get_base_asset(symbol)
 
         qty = self.get_asset_free(base_asset)
@@ -394,7 +620,7 @@ class Binance:
         )
 
         try:
-            order = self._client.create_order(
+            order = self._create_order(
                 symbol=symbol,
                 side="SELL",
                 type="STOP_LOSS_LIMIT",
@@ -417,6 +643,7 @@ class Binance:
         asset = asset.upper()
         logger.info(f"CONVERT DUST TO BNB | asset={asset}")
         result = self._client.transfer_dust(asset=asset)
+        self._invalidate_balances()
         logger.success(f"DUST CONVERTED | asset={asset} | result={result}")
         return result
 
@@ -437,7 +664,7 @@ class Binance:
 
         logger.info(f"BNB → BTC | qty={qty_str}")
 
-        order = self._client.create_order(
+        order = self._create_order(
             symbol=symbol,
             side="SELL",
             type="MARKET",
@@ -466,20 +693,22 @@ class Binance:
         Returns True if price is too far ABOVE SMA (overextended).
         """
         klines = self.get_klines(symbol=symbol, interval=interval, limit=limit)
-        closes = [float(k[4]) for k in klines]
+        closes = _closes_arr(klines)
 
         if len(closes) < sma_period:
             return False
 
-        sma_val = sum(closes[-sma_period:]) / sma_period
-        current = closes[-1]
+        sma_val = self._sma(closes, sma_period)
+        current = float(closes[-1])
 
         deviation = (current - sma_val) / sma_val
 
-        logger.info(
-            f"OVEREXT CHECK | {symbol} | price={current:.2f} | "
-            f"SMA{sma_period}={sma_val:.2f} | dev={deviation*100:.2f}%"
-        )
+        throttle = self._overext_log.setdefault(symbol, _Throttle(60.0))
+        if throttle.ok():
+            logger.info(
+                f"OVEREXT CHECK | {symbol} | price={current:.2f} | "
+                f"SMA{sma_period}={sma_val:.2f} | dev={deviation*100:.2f}%"
+            )
 
         return deviation > max_deviation_pct
 
@@ -499,7 +728,6 @@ class Binance:
         on_update: Optional[Callable[[dict[str, float]], None]] = None,
         initial_max_price: Optional[float] = None,
     ) -> dict | None:
-        symbol = symbol.upper()
         base_asset = self._get_base_asset(symbol)
 
         min_exit_notional_usdt = 5.0
@@ -507,6 +735,12 @@ class Binance:
         current = self.get_price(symbol)
         max_price = max(current, initial_max_price) if initial_max_price else current
         last_new_high_ts = start_ts
+        # The SMA only moves once per candle; re-check when the cached one closes
+        next_sma_check_ts = start_ts
+        sma_slow: Optional[float] = None
+        new_high_log = _Throttle(10.0)
+        # Ticks can arrive many times a second; state/persistence hooks don't need to
+        next_update_ts = start_ts
 
         logger.info(
             f"TRAILING START | {symbol} | trailing={trailing_pct*100:.2f}% | "
@@ -514,153 +748,210 @@ class Binance:
             f"time_stop={max_hold_seconds_without_new_high:.0f}s | trend_exit={trend_exit_enabled}"
         )
 
-        while True:
-            now = time.time()
-
-            if max_runtime_seconds is not None and (now - start_ts) >= max_runtime_seconds:
-                logger.warning("TRAILING STOP ended by max_runtime_seconds")
-                return None
-
-            qty = self.get_asset_free(base_asset)
-            if qty <= 0.0:
-                logger.warning(f"TRAILING STOP ended: no {base_asset} free balance")
-                return None
-
-            current = self.get_price(symbol)
-            notional = qty * current
-            if notional < min_exit_notional_usdt:
-                logger.info(
-                    f"EXIT ABORTED | {symbol} | reason=NOTIONAL_TOO_SMALL | "
-                    f"qty={qty:.8f} | price={current:.2f} | notional={notional:.2f} USDT"
-                )
-                return None
-
-            # Update max price
-            if current > max_price * (1 + new_high_epsilon_pct):
-                max_price = current
-                last_new_high_ts = now
-                logger.info(f"NEW HIGH | {symbol} | max_price={max_price:.2f}")
-
-            if (now - start_ts) < min_hold_seconds:
-                time.sleep(poll_seconds)
-                continue
-
-            # 1) TIME STOP — purely time-based
-            if (now - last_new_high_ts) >= max_hold_seconds_without_new_high:
-                logger.warning(
-                    f"TIME STOP TRIGGER | {symbol} | "
-                    f"no_new_high_for={(now - last_new_high_ts):.0f}s | "
-                    f"current={current:.2f} | max={max_price:.2f}"
-                )
-
-                try:
-                    self._require_tradeable_qty(
-                        symbol,
-                        qty,
-                        context="Time stop sell",
-                        ignore_min_trade=True,
+        twm = self._start_trailing_streams(symbol, base_asset)
+        try:
+            while True:
+                now = time.time()
+
+                if max_runtime_seconds is not None and (now - start_ts) >= max_runtime_seconds:
+                    logger.warning("TRAILING STOP ended by max_runtime_seconds")
+                    return None
+
+                qty = self._streamed_asset_free(base_asset, max_age=poll_seconds)
+                if qty <= 0.0:
+                    logger.warning(f"TRAILING STOP ended: no {base_asset} free balance")
+                    return None
+
+                current = self._streamed_price(symbol, max_age=poll_seconds)
+                notional = qty * current
+                if notional < min_exit_notional_usdt:
+                    logger.info(
+                        f"EXIT ABORTED | {symbol} | reason=NOTIONAL_TOO_SMALL | "
+                        f"qty={qty:.8f} | price={current:.2f} | notional={notional:.2f} USDT"
                     )
-                except ValueError as e:
-                    logger.warning(str(e))
-                    time.sleep(poll_seconds)
-                    continue
+                    return None
 
-                order = self.safe_sell_all(symbol)
-                if order:
-                    return order
+                # Update max price
+                if current > max_price * (1 + new_high_epsilon_pct):
+                    max_price = current
+                    last_new_high_ts = now
+                    if new_high_log.ok():
+                        logger.info(f"NEW HIGH | {symbol} | max_price={max_price:.2f}")
 
-            # 2) TREND EXIT — SMA based
-            if trend_exit_enabled:
-                try:
-                    sma_slow = self.get_sma(
-                        symbol=symbol,
-                        interval=trend_interval,
-                        limit=trend_limit,
-                        period=trend_sma_period,
+                if (now - start_ts) < min_hold_seconds:
+                    self._wait_tick(symbol, poll_seconds)
+                    continue
+
+                # 1) TIME STOP — purely time-based
+                if (now - last_new_high_ts) >= max_hold_seconds_without_new_high:
+                    logger.warning(
+                        f"TIME STOP TRIGGER | {symbol} | "
+                        f"no_new_high_for={(now - last_new_high_ts):.0f}s | "
+                        f"current={current:.2f} | max={max_price:.2f}"
                     )
 
-                    if current < sma_slow:
-                        logger.warning(
-                            f"TREND EXIT TRIGGER | {symbol} | "
-                            f"current={current:.2f} < SMA{trend_sma_period}={sma_slow:.2f}"
+                    try:
+                        self._require_tradeable_qty(
+                            symbol,
+                            qty,
+                            context="Time stop sell",
+                            ignore_min_trade=True,
+                            price=current,
                         )
+                    except ValueError as e:
+                        logger.warning(str(e))
+                        self._wait_tick(symbol, poll_seconds)
+                        continue
+
+                    order = self._trailing_exit_sell(symbol, base_asset)
+                    if order:
+                        return order
+
+                # 2) TREND EXIT — SMA based
+                if trend_exit_enabled:
+                    try:
+                        if now >= next_sma_check_ts:
+                            sma_slow = self.get_sma(
+                                symbol=symbol,
+                                interval=trend_interval,
+                                limit=trend_limit,
+                                period=trend_sma_period,
+                            )
+                            next_sma_check_ts = self._closes_valid_until(symbol, trend_interval)
 
-                        try:
-                            self._require_tradeable_qty(
-                                symbol,
-                                qty,
-                                context="Trend exit sell",
-                                ignore_min_trade=True,
+                        if sma_slow is not None and current < sma_slow:
+                            logger.warning(
+                                f"TREND EXIT TRIGGER | {symbol} | "
+                                f"current={current:.2f} < SMA{trend_sma_period}={sma_slow:.2f}"
                             )
-                        except ValueError as e:
-                            logger.warning(str(e))
-                            time.sleep(poll_seconds)
-                            continue
-
-                        order = self.safe_sell_all(symbol)
-                        if order:
-                            return order
-                except Exception as e:
-                    logger.warning(f"TREND EXIT skipped (calc error): {e}")
-
-            # 3) TRAILING STOP — price based
-            stop_price = max_price * (1 - trailing_pct)
-            if on_update:
-                try:
-                    on_update(
-                        {
-                            "current": current,
-                            "max_price": max_price,
-                            "stop_price": stop_price,
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Trailing update hook failed: {e}")
-            if current <= stop_price:
-                drop_pct = (max_price - current) / max_price
-                logger.warning(
-                    f"TRAILING TRIGGER | {symbol} | "
-                    f"current={current:.2f} | stop={stop_price:.2f} | "
-                    f"drop={drop_pct*100:.2f}%"
-                )
 
-                try:
-                    self._require_tradeable_qty(
-                        symbol,
-                        qty,
-                        context="Trailing sell",
-                        ignore_min_trade=True,
+                            try:
+                                self._require_tradeable_qty(
+                                    symbol,
+                                    qty,
+                                    context="Trend exit sell",
+                                    ignore_min_trade=True,
+                                    price=current,
+                                )
+                            except ValueError as e:
+                                logger.warning(str(e))
+                                self._wait_tick(symbol, poll_seconds)
+                                continue
+
+                            order = self._trailing_exit_sell(symbol, base_asset)
+                            if order:
+                                return order
+                    except Exception as e:
+                        logger.warning(f"TREND EXIT skipped (calc error): {e}")
+
+                # 3) TRAILING STOP — price based
+                stop_price = max_price * (1 - trailing_pct)
+                if on_update and now >= next_update_ts:
+                    next_update_ts = now + poll_seconds
+                    try:
+                        on_update(
+                            {
+                                "current": current,
+                                "max_price": max_price,
+                                "stop_price": stop_price,
+                            }
+                        )
+                    except Exception as e:
+                        logger.warning(f"Trailing update hook failed: {e}")
+                if current <= stop_price:
+                    drop_pct = (max_price - current) / max_price
+                    logger.warning(
+                        f"TRAILING TRIGGER | {symbol} | "
+                        f"current={current:.2f} | stop={stop_price:.2f} | "
+                        f"drop={drop_pct*100:.2f}%"
                     )
-                except ValueError as e:
-                    logger.warning(str(e))
-                    time.sleep(poll_seconds)
-                    continue
 
-                order = self.safe_sell_all(symbol)
-                if order:
-                    return order
+                    try:
+                        self._require_tradeable_qty(
+                            symbol,
+                            qty,
+                            context="Trailing sell",
+                            ignore_min_trade=True,
+                            price=current,
+                        )
+                    except ValueError as e:
+                        logger.warning(str(e))
+                        self._wait_tick(symbol, poll_seconds)
+                        continue
+
+                    order = self._trailing_exit_sell(symbol, base_asset)
+                    if order:
+                        return order
+
+                self._wait_tick(symbol, poll_seconds)
+        finally:
+            if twm is not None:
+                twm.stop()
+            self._tick_events.pop(symbol, None)
+            self._streamed_assets.discard(base_asset)
+
+    def _sma(self, closes: np.ndarray, period: int) -> float:
+        if len(closes) < period:
+            raise ValueError("Not enough data for SMA")
+        return float(closes[-period:].mean())
+
+    def _cached_closes(self, symbol: str, interval: str, limit: int) -> np.ndarray:
+        """
+        Last `limit` closes, refetched at most once per candle. Once seeded,
+        only the candles from the last cached one onwards are requested.
+        """
+        key = (symbol, interval)
+        cached = self._closes_cache.get(key)
+
+        klines = None
+        if cached is not None and len(cached[2]) >= limit:
+            close_ms, open_ts, closes = cached
+            # Binance's own close time: weekly and monthly candles follow the
+            # calendar, not a fixed number of seconds
+            if time.time() * 1000 <= close_ms:
+                return closes[-limit:]
+            # The last cached candle was still forming; refetch it with the new ones
+            klines = self._client.get_klines(
+                symbol=symbol, interval=interval, startTime=int(open_ts[-1]), limit=limit
+            )
+            if len(klines) >= limit:
+                # The gap may be wider than the window; take the latest candles instead
+                klines = None
+
+        if klines is None:
+            klines = self.get_klines(symbol=symbol, interval=interval, limit=limit)
+            cached = None
+        if not klines:
+            return cached[2][-limit:] if cached is not None else _closes_arr(klines)
 
-            time.sleep(poll_seconds)
+        new_ts = np.fromiter((k[0] for k in klines), dtype=np.int64, count=len(klines))
+        new_closes = _closes_arr(klines)
 
-    def _sma(self, values: list[float], period: int) -> float:
-        if len(values) < period:
-            raise ValueError("Not enough data for SMA")
-        return sum(values[-period:]) / period
+        if cached is not None:
+            keep = open_ts < new_ts[0]
+            new_ts = np.concatenate((open_ts[keep], new_ts))[-limit:]
+            new_closes = np.concatenate((closes[keep], new_closes))[-limit:]
+
+        self._closes_cache[key] = (int(klines[-1][6]), new_ts, new_closes)
+        return new_closes
+
+    def _closes_valid_until(self, symbol: str, interval: str) -> float:
+        """
+        Epoch seconds at which the cached closes for symbol/interval go stale.
+        """
+        cached = self._closes_cache.get((symbol, interval))
+        return cached[0] / 1000 if cached is not None else 0.0
 
     def get_sma(self, symbol: str, interval: str, limit: int, period: int) -> float:
-        klines = self.get_klines(symbol=symbol, interval=interval, limit=limit)
-        closes = [float(k[4]) for k in klines]
-        return self._sma(closes, period)
+        return self._sma(self._cached_closes(symbol, interval, limit), period)
 
 
-class BinanceMarketData:
+class BinanceMarketData(MarketData):
     def __init__(self):
         self._client = Client()
 
     def get_price(self, symbol: str) -> float:
-        symbol = symbol.upper()
         return float(self._client.get_symbol_ticker(symbol=symbol)["price"])
 
     def get_klines(self, symbol: str, interval: str, limit: int = 50) -> list:
-        symbol = symbol.upper()
         return self._client.get_klines(symbol=symbol, interval=interval, limit=limit)
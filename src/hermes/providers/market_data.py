@@ -1,6 +1,24 @@
+import numpy as np
+
+# Column layout of the arrays returned by klines_to_array
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+def klines_to_array(klines: list) -> np.ndarray:
+    """
+    Parse raw Binance klines into an (n, 5) float64 OHLCV array in one pass.
+    """
+    if not klines:
+        return np.empty((0, 5), dtype=np.float64)
+    return np.asarray([k[1:6] for k in klines], dtype=np.float64)
+
+
 class MarketData:
     def get_klines(self, symbol: str, interval: str, limit: int = 50) -> list:
         raise NotImplementedError
 
     def get_price(self, symbol: str) -> float:
         raise NotImplementedError
+
+    def get_kline_array(self, symbol: str, interval: str, limit: int = 50) -> np.ndarray:
+        return klines_to_array(self.get_klines(symbol, interval, limit))
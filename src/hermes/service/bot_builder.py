@@ -1,66 +1,139 @@
 # src/service/bot_builder.py
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional
 
 from hermes.utils.bot_config import BotConfig
-from hermes.service.profiles import PROFILES
+from hermes.service.profiles import PROFILES, PROFILE_KEYS
+
+_REQUIRED: frozenset[str] = frozenset({
+    "bot_id",
+    "symbol",
+    "base_asset",
+    "profile",
+    "capital_pct",
+    "trade_pct",
+    "min_trade_usdt",
+    "max_buys_per_day",
+    "daily_budget_usdt",
+    "disable_max_buys_per_day",
+    "disable_daily_budget",
+    "sma_fast",
+    "sma_slow",
+    "trailing_pct",
+    "new_high_epsilon_pct",
+    "kline_interval",
+    "kline_limit",
+    "cooldown_after_sell_seconds",
+})
+
+# Once a profile is applied its fields are known to be present
+_REQUIRED_WITHOUT_PROFILE = _REQUIRED - PROFILE_KEYS - {"profile"}
+
+_DEFAULTS = {
+    "kline_interval": "1m",
+    "kline_limit": 60,
+    "cooldown_after_sell_seconds": 60,
+    "trend_exit_enabled": True,
+    "trend_sma_period": 25,
+    "max_hold_seconds_without_new_high": 5 * 60,
+    "new_high_epsilon_pct": 0.0002,
+    "disable_max_buys_per_day": False,
+    "disable_daily_budget": False,
+}
+
+
+@dataclass(slots=True)
+class _PartialConfig:
+    """
+    BotConfig fields as they are filled in; None means "not set yet".
+    """
+    bot_id: Optional[str] = None
+    symbol: Optional[str] = None
+    base_asset: Optional[str] = None
+    profile: Optional[str] = None
+
+    capital_pct: Optional[float] = None
+    trade_pct: Optional[float] = None
+    min_trade_usdt: Optional[float] = None
+    max_buys_per_day: Optional[int] = None
+    daily_budget_usdt: Optional[float] = None
+    disable_max_buys_per_day: Optional[bool] = None
+    disable_daily_budget: Optional[bool] = None
+
+    sma_fast: Optional[int] = None
+    sma_slow: Optional[int] = None
+    kline_interval: Optional[str] = None
+    kline_limit: Optional[int] = None
+
+    trailing_pct: Optional[float] = None
+    new_high_epsilon_pct: Optional[float] = None
+    cooldown_after_sell_seconds: Optional[float] = None
+
+    trend_exit_enabled: Optional[bool] = None
+    trend_sma_period: Optional[int] = None
+    max_hold_seconds_without_new_high: Optional[float] = None
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(_PartialConfig))
+# A BotConfig field missing here would never reach the built config
+if set(_FIELD_NAMES) != {f.name for f in fields(BotConfig)}:
+    raise ValueError(
+        "_PartialConfig drifted from BotConfig: "
+        f"{sorted(set(_FIELD_NAMES) ^ {f.name for f in fields(BotConfig)})}"
+    )
 
 
 class BotBuilder:
     def __init__(self):
-        self._config: dict = {}
+        self._p = _PartialConfig()
 
     def with_symbol(self, symbol: str, base_asset: str):
-        self._config["symbol"] = symbol.upper()
-        self._config["base_asset"] = base_asset.upper()
+        self._p.symbol = symbol.upper()
+        self._p.base_asset = base_asset.upper()
         return self
 
     def with_profile(self, profile_name: str):
-        if profile_name not in PROFILES:
+        profile = PROFILES.get(profile_name)
+        if profile is None:
             raise ValueError(f"Unknown profile: {profile_name}")
 
-        self._config.update(PROFILES[profile_name])
-        self._config["profile"] = profile_name
+        for name, value in profile.items():
+            setattr(self._p, name, value)
+        self._p.profile = profile_name
         return self
 
     def with_defaults(self):
-        self._config.setdefault("kline_interval", "1m")
-        self._config.setdefault("kline_limit", 60)
-        self._config.setdefault("cooldown_after_sell_seconds", 60)
-        self._config.setdefault("trend_exit_enabled", True)
-        self._config.setdefault("trend_sma_period", 25)
-        self._config.setdefault("max_hold_seconds_without_new_high", 5 * 60)
-        self._config.setdefault("new_high_epsilon_pct", 0.0002)
-        self._config.setdefault("disable_max_buys_per_day", False)
-        self._config.setdefault("disable_daily_budget", False)
+        for name, value in _DEFAULTS.items():
+            if getattr(self._p, name) is None:
+                setattr(self._p, name, value)
         return self
 
     def build(self) -> BotConfig:
-        if "bot_id" not in self._config and "profile" in self._config and "base_asset" in self._config:
-            bot_id = f"{self._config['profile']}_{self._config['base_asset'].lower()}"
-            self._config["bot_id"] = bot_id
-
-        required_fields = [
-            "bot_id",
-            "symbol",
-            "base_asset",
-            "profile",
-            "capital_pct",
-            "trade_pct",
-            "min_trade_usdt",
-            "max_buys_per_day",
-            "daily_budget_usdt",
-            "disable_max_buys_per_day",
-            "disable_daily_budget",
-            "sma_fast",
-            "sma_slow",
-            "trailing_pct",
-            "new_high_epsilon_pct",
-            "kline_interval",
-            "kline_limit",
-            "cooldown_after_sell_seconds",
-        ]
-
-        missing = [f for f in required_fields if f not in self._config]
+        p = self._p
+        if p.bot_id is None and p.profile is not None and p.base_asset is not None:
+            p.bot_id = f"{p.profile}_{p.base_asset.lower()}"
+
+        # Unset optional fields fall back to BotConfig's own defaults
+        values = {name: value for name in _FIELD_NAMES if (value := getattr(p, name)) is not None}
+
+        required = _REQUIRED if p.profile is None else _REQUIRED_WITHOUT_PROFILE
+        missing = required - values.keys()
         if missing:
-            raise ValueError(f"Missing BotConfig fields: {missing}")
+            raise ValueError(f"Missing BotConfig fields: {sorted(missing)}")
+        return BotConfig(**values)
+
 
-        return BotConfig(**self._config)
+# BotConfig is frozen, so callers asking for the same bot share one instance
+@lru_cache(maxsize=64)
+def make_bot_config(symbol: str, base_asset: str, profile: str) -> BotConfig:
+    """
+    Standard symbol + profile + defaults config; shared per argument triple.
+    """
+    return (
+        BotBuilder()
+        .with_symbol(symbol, base_asset)
+        .with_profile(profile)
+        .with_defaults()
+        .build()
+    )
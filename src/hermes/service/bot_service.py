@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 import csv
 
-from hermes.service.bot_builder import BotBuilder
+from hermes.service.bot_builder import make_bot_config
 from hermes.config.bot_config_store import save_config
 from hermes.reporting.trade_reporter import TradeReporter
 from hermes.utils.adaptive_controller import AdaptiveController
@@ -47,7 +47,7 @@ class BotService:
             raise RuntimeError(f"Bot already running for {symbol}")
 
         logger.info(
-            "🚀 Starting bot | symbol=%s | profile=%s",
+            "🚀 Starting bot | symbol={} | profile={}",
             symbol,
             config.profile,
         )
@@ -129,7 +129,7 @@ class BotService:
         if not bot:
             raise RuntimeError(f"No running bot for {symbol}")
 
-        logger.warning("🛑 Stopping bot | symbol=%s", symbol)
+        logger.warning("🛑 Stopping bot | symbol={}", symbol)
 
         bot.stop()
         bot.join(timeout=10)
@@ -142,7 +142,7 @@ class BotService:
         symbol = symbol.upper()
 
         logger.info(
-            "♻️ Restarting bot | symbol=%s | profile=%s",
+            "♻️ Restarting bot | symbol={} | profile={}",
             symbol,
             profile,
         )
@@ -150,13 +150,7 @@ class BotService:
         if symbol in self._bots:
             self.stop_bot(symbol)
 
-        config = (
-            BotBuilder()
-            .with_symbol(symbol, base_asset)
-            .with_profile(profile)
-            .with_defaults()
-            .build()
-        )
+        config = make_bot_config(symbol, base_asset, profile)
 
         self.start_bot_from_config(config)
 
@@ -176,7 +170,7 @@ class BotService:
         bot = self._bots.get(symbol.upper())
         if not bot:
             raise RuntimeError(f"No running bot for {symbol}")
-        if bot.open_position_spent <= 0:
+        if bot.state.open_position_spent <= 0:
             bot.binance = None
         bot.state.trading_mode = TradingMode.AI
         bot.state.ai_enabled = True
@@ -246,13 +240,7 @@ class BotService:
         else:
             target_profile = recommended_profile
             base_asset = state.base_asset or state.config.base_asset
-            config = (
-                BotBuilder()
-                .with_symbol(symbol, base_asset)
-                .with_profile(target_profile)
-                .with_defaults()
-                .build()
-            )
+            config = make_bot_config(symbol, base_asset, target_profile)
             config = replace(
                 config,
                 bot_id=state.bot_id,
@@ -341,6 +329,15 @@ class BotService:
     def get_bot_state(self, symbol: str) -> BotRuntimeState | None:
         return self._states.get(symbol.upper())
 
+    def get_bot_snapshot(self, symbol: str) -> BotRuntimeState | None:
+        bot = self._bots.get(symbol.upper())
+        if not bot:
+            return None
+        return bot.snapshot()
+
+    def get_all_snapshots(self) -> list[BotRuntimeState]:
+        return [bot.snapshot() for bot in self._bots.values()]
+
     def get_all_states(self) -> list[BotRuntimeState]:
         return list(self._states.values())
 
@@ -377,7 +374,7 @@ class BotService:
                 "last_action",
             ])
 
-            for state in self._states.values():
+            for state in self.get_all_snapshots():
                 writer.writerow([
                     state.symbol,
                     state.profile,
@@ -388,7 +385,7 @@ class BotService:
                     state.last_action,
                 ])
 
-        logger.info("📄 Global report generated | %s", file_path)
+        logger.info("📄 Global report generated | {}", file_path)
         return str(file_path)
 
     def generate_general_report_csv(self) -> str | None:
@@ -414,7 +411,7 @@ class BotService:
                 "last_update",
             ])
 
-            for state in self._states.values():
+            for state in self.get_all_snapshots():
                 writer.writerow([
                     state.symbol,
                     state.profile,
@@ -426,7 +423,7 @@ class BotService:
                     state.last_update,
                 ])
 
-        logger.info("📄 General report generated | %s", file_path)
+        logger.info("📄 General report generated | {}", file_path)
         return str(file_path)
 
     def get_trade_report_csv(self) -> str | None:
@@ -1,4 +1,5 @@
 # hermes/service/bot_state.py
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
@@ -115,7 +116,7 @@ class BotRuntimeState:
     losses: int = 0
     total_win: float = 0.0
     total_loss: float = 0.0
-    recent_pnls: list[float] = field(default_factory=list)
+    recent_pnls: deque[float] = field(default_factory=lambda: deque(maxlen=10))
     max_drawdown: float = 0.0
     armed_notified: bool = False
 
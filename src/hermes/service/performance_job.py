@@ -95,7 +95,7 @@ def run_performance_window_job(*, window_minutes: int = 60) -> int:
             upserted += 1
 
         session.commit()
-        logger.info("Performance windows upserted: %d", upserted)
+        logger.info("Performance windows upserted: {}", upserted)
         return upserted
 
 
@@ -1,6 +1,7 @@
 # src/service/profiles.py
+from types import MappingProxyType
 
-PROFILES = {
+_RAW_PROFILES = {
     # =========================
     # 🛡️ SENTINEL — Conservative
     # =========================
@@ -52,3 +53,14 @@ PROFILES = {
         "new_high_epsilon_pct": 0.0002,
     },
 }
+
+# Every profile must set the same fields; checked once, at import
+PROFILE_KEYS = frozenset(next(iter(_RAW_PROFILES.values())))
+for _name, _profile in _RAW_PROFILES.items():
+    if _profile.keys() != PROFILE_KEYS:
+        raise ValueError(
+            f"Profile schema drift in {_name!r}: {sorted(PROFILE_KEYS ^ _profile.keys())}"
+        )
+
+# Read-only at both levels, so no consumer can alter a shared profile
+PROFILES = MappingProxyType({k: MappingProxyType(v) for k, v in _RAW_PROFILES.items()})
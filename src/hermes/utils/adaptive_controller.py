@@ -73,8 +73,8 @@ class AdaptiveController:
         metrics = self._compute_metrics(trades)
 
         logger.info(
-            "[ADAPTIVE] Bot=%s | profile=%s | win_rate=%.2f | pnl=%.4f | drawdown=%.2f | "
-            "neg_streak=%d | avg_abs=%.4f | vol=%.4f | flip_rate=%s | state=%s",
+            "[ADAPTIVE] Bot={} | profile={} | win_rate={:.2f} | pnl={:.4f} | drawdown={:.2f} | "
+            "neg_streak={} | avg_abs={:.4f} | vol={:.4f} | flip_rate={} | state={}",
             bot.config.bot_id,
             bot.config.profile,
             metrics.win_rate,
@@ -1,9 +1,11 @@
 # src/utils/bot.py
+import copy
 import time
+from dataclasses import replace
 from enum import Enum
 from threading import Thread
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+import numpy as np
 from loguru import logger
 from sqlalchemy import select
 
@@ -15,8 +17,10 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from hermes.providers.Telegram import TelegramNotifier
 from hermes.reporting.trade_reporter import TradeReporter
 from hermes.reporting.post_mortem_audit import PostMortemAuditor
-from hermes.providers.market_data import MarketData
+from hermes.providers.market_data import MarketData, HIGH, LOW, CLOSE
+from hermes.indicators import vortex_kernel
 from hermes.utils.trading_mode import TradingMode
+from hermes.utils.time import BOGOTA_TZ
 from hermes.utils.adaptive_controller import AdaptiveController, AdaptiveMetrics
 from hermes.persistence.db import SessionLocal
 from hermes.persistence.models import Asset, DecisionType, StrategyProfile
@@ -28,7 +32,6 @@ from hermes.ai.types import MarketRegime
 from hermes.ai.llm_client import HermesLLMClient
 from hermes.ai.llm_guard import LLMGuard
 
-BOGOTA_TZ = ZoneInfo("America/Bogota")
 HEARTBEAT_EVERY_SECONDS = 5.0
 VORTEX_ENTRY_THRESHOLD = 0.5
 AI_SNAPSHOT_WINDOW_SECONDS = 60 * 60
@@ -43,6 +46,32 @@ class AIMode(Enum):
 AI_MODE = AIMode.SHADOW
 
 
+class RiskReason(Enum):
+    OK = "OK"
+    MAX_BUYS = "MAX_BUYS"
+    REAL_CAP = "REAL_CAP"
+    DAILY_BUDGET = "DAILY_BUDGET"
+    NO_USDT = "NO_USDT"
+
+
+class BotPhase(Enum):
+    AI_ANALYSIS = "AI_ANALYSIS"
+    SIMULATION = "SIMULATION"
+    IN_POSITION = "IN_POSITION"
+    VORTEX_LIVE = "VORTEX_LIVE"
+    RISK_CHECK = "RISK_CHECK"
+    WAIT_SIGNAL = "WAIT_SIGNAL"
+    BUY = "BUY"
+
+
+RISK_ACTIONS = {
+    RiskReason.MAX_BUYS: "RISK_MAX_BUYS",
+    RiskReason.REAL_CAP: "RISK_REAL_CAP_LIMIT",
+    RiskReason.DAILY_BUDGET: "RISK_DAILY_BUDGET",
+    RiskReason.NO_USDT: "RISK_NO_USDT",
+}
+
+
 class Bot(Thread):
     def __init__(
         self,
@@ -60,26 +89,37 @@ class Bot(Thread):
         self.market = market_data
         self.binance = binance
         self.state = state
+        # Published copy of `state` for read-only consumers, refreshed once per
+        # cycle. Swapped as a single reference assignment, so readers never see
+        # a half-applied update.
+        self._state_ref: BotRuntimeState | None = None
         self.notifier = notifier
         self.reporter = reporter
         self.adaptive_controller = adaptive_controller
 
         self._running = True
 
-        # Internal runtime (logic-only)
-        self.open_position_spent = 0.0
-        self.buys_today = 0
-        self.spent_today = 0.0
+        # Position, arming and daily counters live only on `state`
         self.current_day = self._day_key()
 
-        # ARMING
-        self.armed = False
-        self.arm_price = None
-        self.ARM_PCT = 0.002  # 0.2%
+        # Per-cycle phase dispatch
+        self._cycle_usdt = 0.0
+        self._cycle_trade_usdt = 0.0
+        self._phase_handlers = {
+            BotPhase.AI_ANALYSIS: self._ai_cycle,
+            BotPhase.SIMULATION: self._simulate_vortex,
+            BotPhase.IN_POSITION: self._handle_in_position,
+            BotPhase.VORTEX_LIVE: self._handle_vortex_live,
+            BotPhase.RISK_CHECK: self._handle_risk_check,
+            BotPhase.WAIT_SIGNAL: self._handle_wait_signal,
+            BotPhase.BUY: self._handle_buy,
+        }
 
         self._last_heartbeat = time.monotonic()
         self._last_decision_log_at = 0.0
         self._cycle_regime = None
+        # Built on the first AI cycle; most sessions never need it
+        self._llm_client: HermesLLMClient | None = None
 
         self._base_trailing_pct = config.trailing_pct
         self._base_max_buys_per_day = config.max_buys_per_day
@@ -142,9 +182,10 @@ class Bot(Thread):
             ai_last_recommendation_id=None,
             ai_last_recommendation_message_id=None,
         )
+        self._publish_snapshot()
 
         logger.info(
-            "🧠 Bot initialized | symbol=%s | profile=%s",
+            "🧠 Bot initialized | symbol={} | profile={}",
             config.symbol,
             config.profile,
         )
@@ -160,6 +201,23 @@ class Bot(Thread):
         if hasattr(self.state, "last_update"):
             self.state.last_update = self._now()
 
+    def _publish_snapshot(self) -> None:
+        # Mutable containers are copied too, so later appends on the live
+        # state can't reach an already-published snapshot.
+        state = self.state
+        self._state_ref = replace(
+            state,
+            recent_pnls=tuple(state.recent_pnls),
+            ai_recommendation=copy.deepcopy(state.ai_recommendation),
+        )
+
+    def snapshot(self) -> BotRuntimeState:
+        """
+        Return the state as of the end of the last cycle. Read fields off the
+        returned object; it is never mutated after publication.
+        """
+        return self._state_ref
+
     def _effective_max_buys_per_day(self) -> int:
         if self.state.adaptive_max_buys_per_day is not None:
             return self.state.adaptive_max_buys_per_day
@@ -276,12 +334,11 @@ class Bot(Thread):
                 armed=False,
             )
             logger.info(
-                "⏳ Bot waiting for arming confirmation | symbol=%s | profile=%s",
+                "⏳ Bot waiting for arming confirmation | symbol={} | profile={}",
                 self.config.symbol,
                 self.config.profile,
             )
         elif self.state.trading_mode == TradingMode.LIVE:
-            self.armed = True
             self._set_state(
                 running=True,
                 last_action="WAIT_SIGNAL",
@@ -292,7 +349,7 @@ class Bot(Thread):
                 live_authorized_at=time.time(),
             )
             logger.info(
-                "✅ Bot armed automatically | symbol=%s | profile=%s",
+                "✅ Bot armed automatically | symbol={} | profile={}",
                 self.config.symbol,
                 self.config.profile,
             )
@@ -307,7 +364,7 @@ class Bot(Thread):
                 live_authorized_at=None,
             )
             logger.info(
-                "🤖 Bot in AI warmup | symbol=%s | profile=%s",
+                "🤖 Bot in AI warmup | symbol={} | profile={}",
                 self.config.symbol,
                 self.config.profile,
             )
@@ -335,6 +392,8 @@ class Bot(Thread):
                 logger.exception("💥 Bot error")
                 self._set_state(last_action="ERROR")
                 time.sleep(5)
+            finally:
+                self._publish_snapshot()
 
         self._set_state(
             running=False,
@@ -343,17 +402,24 @@ class Bot(Thread):
             waiting_for_signal=False,
             trailing_enabled=False,
         )
+        self._publish_snapshot()
 
     def stop(self):
         self._running = False
 
+    def _notify(self, **kwargs) -> None:
+        # Queued on the shared notifier worker; never blocks the trading loop.
+        if self.notifier is None:
+            return
+        self.notifier.send_ephemeral_nowait(**kwargs)
+
     def _preload_metrics(self) -> None:
         try:
             with SessionLocal() as session:
                 profile_id, asset_id = self._ensure_profile_asset(session)
                 self._get_cycle_regime(session, profile_id, asset_id)
         except Exception as e:
-            logger.warning("Metrics preload failed: %s", e)
+            logger.warning("Metrics preload failed: {}", e)
 
     def _heartbeat(self):
         now = time.monotonic()
@@ -362,8 +428,8 @@ class Bot(Thread):
                 "💓 Loop alive | symbol={} | action={} | armed={} | in_position={}",
                 self.state.symbol,
                 self.state.last_action,
-                self.armed,
-                self.open_position_spent > 0,
+                self.state.armed,
+                self.state.open_position_spent > 0,
             )
             self._last_heartbeat = now
 
@@ -372,9 +438,13 @@ class Bot(Thread):
     # =========================
     def _trade_cycle(self):
         self._cycle_regime = None
+        phase = self._start_phase()
+        while phase is not None:
+            phase = self._phase_handlers[phase]()
+
+    def _start_phase(self) -> BotPhase:
         if self.state.trading_mode == TradingMode.AI:
-            self._ai_cycle()
-            return
+            return BotPhase.AI_ANALYSIS
         self._update_read_only_state()
         if self._sleep_expired():
             self.apply_adaptive_state("NORMAL", reason="sleep_expired")
@@ -384,16 +454,13 @@ class Bot(Thread):
         day = self._day_key()
         if day != self.current_day:
             self.current_day = day
-            self.buys_today = 0
-            self.spent_today = 0.0
             self._set_state(
                 buys_today=0,
                 spent_today=0.0,
             )
 
         if self.config.profile == "vortex" and self.state.trading_mode != TradingMode.LIVE:
-            self._simulate_vortex()
-            return
+            return BotPhase.SIMULATION
 
         # =========================
         # Capital snapshot (SAFE)
@@ -410,120 +477,45 @@ class Bot(Thread):
             usdt = self._get_available_capital()
             base_qty = 0.0
 
-        trade_usdt = self._compute_trade_usdt(usdt)
+        self._cycle_usdt = usdt
+        self._cycle_trade_usdt = self._compute_trade_usdt(usdt)
 
         self._set_state(
             usdt_balance=usdt,
             base_balance=base_qty,
-            buys_today=self.buys_today,
-            spent_today=self.spent_today,
         )
 
-        # =========================
-        # 1) In position → manage trailing
-        # =========================
-        if self.open_position_spent > 0:
-            self._set_state(
-                last_action="IN_POSITION",
-                trailing_enabled=True,
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            self._manage_open_position()
-            return
+        if self.state.open_position_spent > 0:
+            return BotPhase.IN_POSITION
 
         if self.config.profile == "vortex" and self.state.trading_mode == TradingMode.LIVE:
-            self._vortex_live_cycle(usdt)
-            return
-
-        if self.config.profile == "vortex":
-            # =========================
-            # 2) ARMING (VORTEX ONLY)
-            # =========================
-            price = float(self.market.get_price(self.config.symbol))
-            self._set_state(last_price=price)
-
-            if self.arm_price is None:
-                self.arm_price = price
-                self._set_state(
-                    arm_price=price,
-                    last_action="ARM_INIT",
-                    waiting_for_confirmation=True,
-                    waiting_for_signal=False,
-                    armed=False,
-                )
-                time.sleep(10)
-                return
+            return BotPhase.VORTEX_LIVE
 
-            if not self.armed:
-                if price >= self.arm_price * (1 + self.ARM_PCT):
-                    self.armed = True
-                    self._set_state(
-                        armed=True,
-                        last_action="ARMED",
-                        waiting_for_confirmation=False,
-                        waiting_for_signal=False,
-                    )
-                else:
-                    self._set_state(
-                        last_action="WAIT_CONFIRMATION",
-                        waiting_for_confirmation=True,
-                        waiting_for_signal=False,
-                        armed=False,
-                    )
-                    time.sleep(10)
-                    return
+        return BotPhase.RISK_CHECK
 
-        # =========================
-        # 3) Risk checks
-        # =========================
-        if (not self.config.disable_max_buys_per_day) and self.buys_today >= self._effective_max_buys_per_day():
-            self._set_state(
-                last_action="RISK_MAX_BUYS",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
-
-        if (
-            self.state.real_capital_enabled
-            and self.state.trading_mode == TradingMode.LIVE
-            and self.spent_today + trade_usdt > self.state.real_capital_limit
-        ):
-            self._set_state(
-                last_action="RISK_REAL_CAP_LIMIT",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
+    # =========================
+    # Phase handlers
+    # =========================
+    def _handle_in_position(self) -> BotPhase | None:
+        self._set_state(
+            last_action="IN_POSITION",
+            trailing_enabled=True,
+            waiting_for_signal=False,
+            waiting_for_confirmation=False,
+        )
+        self._manage_open_position()
+        return None
 
-        if (not self.config.disable_daily_budget) and self.spent_today + trade_usdt > self.config.daily_budget_usdt:
-            self._set_state(
-                last_action="RISK_DAILY_BUDGET",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
+    def _handle_vortex_live(self) -> BotPhase | None:
+        self._vortex_live_cycle(self._cycle_usdt)
+        return None
 
-        if trade_usdt <= 0 or usdt < trade_usdt:
-            self._notify_capital_skip(trade_usdt, usdt)
-            self._set_state(
-                last_action="RISK_NO_USDT",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
-        else:
-            if self.state.capital_skip_notified:
-                self._set_state(capital_skip_notified=False)
+    def _handle_risk_check(self) -> BotPhase | None:
+        if not self._pass_risk_gate(self._cycle_usdt, self._cycle_trade_usdt):
+            return None
+        return BotPhase.WAIT_SIGNAL
 
-        # =========================
-        # 4) Entry signal
-        # =========================
+    def _handle_wait_signal(self) -> BotPhase | None:
         self._set_state(
             last_action="CHECK_SIGNAL",
             waiting_for_signal=True,
@@ -543,7 +535,7 @@ class Bot(Thread):
                 min_interval_seconds=300.0,
             )
             time.sleep(10)
-            return
+            return None
 
         if not signal:
             self._set_state(
@@ -552,12 +544,13 @@ class Bot(Thread):
                 waiting_for_confirmation=False,
             )
             time.sleep(10)
-            return
+            return None
 
-        # =========================
-        # 5) BUY
-        # =========================
-        self._buy(trade_usdt)
+        return BotPhase.BUY
+
+    def _handle_buy(self) -> BotPhase | None:
+        self._buy(self._cycle_trade_usdt)
+        return None
 
     def _ai_cycle(self) -> None:
         self._update_market_snapshot()
@@ -566,28 +559,30 @@ class Bot(Thread):
         time.sleep(5)
 
     def _update_market_snapshot(self) -> None:
+        cfg = self.config
+        fast_n, slow_n = cfg.sma_fast, cfg.sma_slow
         try:
-            klines = self.market.get_klines(
-                self.config.symbol,
-                self.config.kline_interval,
-                self.config.kline_limit,
+            klines = self.market.get_kline_array(
+                cfg.symbol,
+                cfg.kline_interval,
+                cfg.kline_limit,
             )
         except Exception as e:
-            logger.warning("Market snapshot failed: %s", e)
+            logger.warning("Market snapshot failed: {}", e)
             return
 
-        if not klines:
+        if len(klines) == 0:
             return
 
-        closes = [float(k[4]) for k in klines]
-        current = closes[-1]
+        closes = klines[:, CLOSE]
+        current = float(closes[-1])
         self._set_state(last_price=current)
 
-        if len(closes) < self.config.sma_slow:
+        if len(closes) < slow_n:
             return
 
-        fast = sum(closes[-self.config.sma_fast:]) / self.config.sma_fast
-        slow = sum(closes[-self.config.sma_slow:]) / self.config.sma_slow
+        fast = float(closes[-fast_n:].mean())
+        slow = float(closes[-slow_n:].mean())
         entry_price = current if fast > slow else None
 
         self._set_state(
@@ -743,12 +738,13 @@ class Bot(Thread):
             self._send_ai_recommendation_message(recommendation)
             return
 
-        client = HermesLLMClient()
+        if self._llm_client is None:
+            self._llm_client = HermesLLMClient()
         try:
-            response = client.analyze_market(snapshot)
+            response = self._llm_client.analyze_market(snapshot)
             response = LLMGuard.validate(response)
         except Exception as e:
-            logger.warning("AI recommendation failed: %s", e)
+            logger.warning("AI recommendation failed: {}", e)
             self._set_state(
                 ai_last_decision="ERROR",
                 ai_last_reason=str(e),
@@ -845,7 +841,7 @@ class Bot(Thread):
     # =========================
     def _simulate_vortex(self):
         try:
-            klines = self.market.get_klines(
+            klines = self.market.get_kline_array(
                 self.config.symbol,
                 self.config.kline_interval,
                 self.config.kline_limit,
@@ -856,10 +852,10 @@ class Bot(Thread):
                 waiting_for_signal=False,
                 waiting_for_confirmation=False,
             )
-            logger.warning("Vortex data fetch failed: %s", e)
+            logger.warning("Vortex data fetch failed: {}", e)
             time.sleep(5)
             return
-        if not klines:
+        if len(klines) == 0:
             return
 
         price, score = self._compute_vortex_score(klines)
@@ -902,12 +898,12 @@ class Bot(Thread):
             virtual_pnl = self.state.virtual_pnl + pnl
             total_win = self.state.total_win + (pnl if pnl > 0 else 0.0)
             total_loss = self.state.total_loss + (abs(pnl) if pnl < 0 else 0.0)
-            recent_pnls = (self.state.recent_pnls + [pnl])[-10:]
             virtual_peak_pnl = max(self.state.virtual_peak_pnl, virtual_pnl)
             drawdown = 0.0
             if virtual_peak_pnl > 0:
                 drawdown = (virtual_peak_pnl - virtual_pnl) / virtual_peak_pnl
             max_drawdown = max(self.state.max_drawdown, drawdown)
+            self.state.recent_pnls.append(pnl)
             self._set_state(
                 entry_price=None,
                 stop_price=None,
@@ -922,7 +918,6 @@ class Bot(Thread):
                 losses=losses,
                 total_win=total_win,
                 total_loss=total_loss,
-                recent_pnls=recent_pnls,
                 max_drawdown=max_drawdown,
             )
 
@@ -933,7 +928,7 @@ class Bot(Thread):
 
     def _vortex_live_cycle(self, usdt: float) -> None:
         try:
-            klines = self.market.get_klines(
+            klines = self.market.get_kline_array(
                 self.config.symbol,
                 self.config.kline_interval,
                 self.config.kline_limit,
@@ -944,10 +939,10 @@ class Bot(Thread):
                 waiting_for_signal=False,
                 waiting_for_confirmation=False,
             )
-            logger.warning("Vortex live data fetch failed: %s", e)
+            logger.warning("Vortex live data fetch failed: {}", e)
             time.sleep(5)
             return
-        if not klines:
+        if len(klines) == 0:
             return
 
         price, score = self._compute_vortex_score(klines)
@@ -1013,7 +1008,7 @@ class Bot(Thread):
                         ]
                     ]
                 )
-                self.notifier.send_ephemeral_sync(
+                self._notify(
                     text=(
                         "🟣 <b>VORTEX SIGNAL</b>\n"
                         f"{self.config.symbol}\n"
@@ -1038,65 +1033,61 @@ class Bot(Thread):
                 return
 
         trade_usdt = self._compute_trade_usdt(usdt)
-
-        if (not self.config.disable_max_buys_per_day) and self.buys_today >= self._effective_max_buys_per_day():
-            self._set_state(
-                last_action="RISK_MAX_BUYS",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
+        if not self._pass_risk_gate(usdt, trade_usdt):
             return
 
+        self._set_state(
+            entry_price=price,
+            awaiting_fresh_entry=False,
+        )
+        self._buy(trade_usdt)
+
+    # =========================
+    # Risk gate
+    # =========================
+    def _risk_gate(self, usdt: float, trade_usdt: float) -> RiskReason:
+        cfg = self.config
+        state = self.state
+
+        if (not cfg.disable_max_buys_per_day) and state.buys_today >= self._effective_max_buys_per_day():
+            return RiskReason.MAX_BUYS
+
+        next_spent = state.spent_today + trade_usdt
         if (
-            self.state.real_capital_enabled
-            and self.spent_today + trade_usdt > self.state.real_capital_limit
+            state.real_capital_enabled
+            and state.trading_mode == TradingMode.LIVE
+            and next_spent > state.real_capital_limit
         ):
-            self._set_state(
-                last_action="RISK_REAL_CAP_LIMIT",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
+            return RiskReason.REAL_CAP
 
-        if (not self.config.disable_daily_budget) and self.spent_today + trade_usdt > self.config.daily_budget_usdt:
-            self._set_state(
-                last_action="RISK_DAILY_BUDGET",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
+        if (not cfg.disable_daily_budget) and next_spent > cfg.daily_budget_usdt:
+            return RiskReason.DAILY_BUDGET
 
         if trade_usdt <= 0 or usdt < trade_usdt:
-            self._notify_capital_skip(trade_usdt, usdt)
-            self._set_state(
-                last_action="RISK_NO_USDT",
-                waiting_for_signal=False,
-                waiting_for_confirmation=False,
-            )
-            time.sleep(10)
-            return
-        else:
+            return RiskReason.NO_USDT
+
+        return RiskReason.OK
+
+    def _pass_risk_gate(self, usdt: float, trade_usdt: float) -> bool:
+        reason = self._risk_gate(usdt, trade_usdt)
+        if reason is RiskReason.OK:
             if self.state.capital_skip_notified:
                 self._set_state(capital_skip_notified=False)
+            return True
 
+        if reason is RiskReason.NO_USDT:
+            self._notify_capital_skip(trade_usdt, usdt)
         self._set_state(
-            entry_price=price,
-            awaiting_fresh_entry=False,
+            last_action=RISK_ACTIONS[reason],
+            waiting_for_signal=False,
+            waiting_for_confirmation=False,
         )
-        self._buy(trade_usdt)
-
-    def _compute_vortex_score(self, klines: list) -> tuple[float, float]:
-        highs = [float(k[2]) for k in klines]
-        lows = [float(k[3]) for k in klines]
-        closes = [float(k[4]) for k in klines]
+        time.sleep(10)
+        return False
 
-        price = closes[-1]
-        velocity = self._compute_velocity(closes)
-        atr = self._compute_atr(highs, lows, closes)
-        score = velocity / atr if atr > 0 else 0.0
+    def _compute_vortex_score(self, klines: np.ndarray) -> tuple[float, float]:
+        price, score = vortex_kernel(klines[:, HIGH], klines[:, LOW], klines[:, CLOSE])
+        price, score = float(price), float(score)
 
         if score > VORTEX_ENTRY_THRESHOLD:
             self._set_state(last_signal_ts=time.time())
@@ -1127,10 +1118,10 @@ class Bot(Thread):
             raise RuntimeError("🚫 Binance access blocked: not authorized LIVE mode")
 
     def _require_live_or_protect_position(self) -> None:
-        if self.open_position_spent > 0 and self.binance is not None:
+        if self.state.open_position_spent > 0 and self.binance is not None:
             if self.state.trading_mode != TradingMode.LIVE or not self.state.live_authorized:
                 logger.warning(
-                    "⚠️ Protective access granted outside LIVE mode | symbol=%s | mode=%s",
+                    "⚠️ Protective access granted outside LIVE mode | symbol={} | mode={}",
                     self.config.symbol,
                     self.state.trading_mode,
                 )
@@ -1149,7 +1140,6 @@ class Bot(Thread):
         max_price = persisted.get("max_price", entry_price)
 
         if entry_price and spent > 0:
-            self.open_position_spent = spent
             self._set_state(
                 last_action="REHYDRATED_TRAILING",
                 entry_price=entry_price,
@@ -1164,7 +1154,7 @@ class Bot(Thread):
                 ),
             )
             logger.warning(
-                "🔁 Rehydrated open position | symbol=%s | entry=%.4f | max=%.4f",
+                "🔁 Rehydrated open position | symbol={} | entry={:.4f} | max={:.4f}",
                 self.config.symbol,
                 entry_price,
                 max_price or entry_price,
@@ -1197,32 +1187,13 @@ class Bot(Thread):
             ]
         )
 
-        self.notifier.send_ephemeral_sync(
+        self._notify(
             text=text,
             delete_after=0,
             silent=False,
             reply_markup=keyboard,
         )
 
-    def _compute_velocity(self, prices: list[float], n: int = 5) -> float:
-        if len(prices) < n + 1:
-            return 0.0
-        return (prices[-1] - prices[-n - 1]) / n
-
-    def _compute_atr(
-        self,
-        highs: list[float],
-        lows: list[float],
-        closes: list[float],
-        n: int = 14,
-    ) -> float:
-        if len(closes) < n + 1:
-            return 0.0
-        trs = []
-        for i in range(1, len(closes)):
-            trs.append(max(highs[i], closes[i - 1]) - min(lows[i], closes[i - 1]))
-        return sum(trs[-n:]) / n
-
     # =========================
     # Trading actions
     # =========================
@@ -1234,16 +1205,12 @@ class Bot(Thread):
         qty = float(order.get("executedQty", 0.0))
         price = spent / qty if qty else 0.0
 
-        self.open_position_spent = spent
-        self.buys_today += 1
-        self.spent_today += spent
-
         self._set_state(
             last_action="BUY_FILLED",
             open_position_spent=spent,
             entry_price=price,
-            buys_today=self.buys_today,
-            spent_today=self.spent_today,
+            buys_today=self.state.buys_today + 1,
+            spent_today=self.state.spent_today + spent,
             trailing_enabled=False,
             waiting_for_signal=False,
             waiting_for_confirmation=False,
@@ -1280,7 +1247,7 @@ class Bot(Thread):
             return
 
         capital_allowed = wallet_usdt * self.config.capital_pct
-        capital_used = self.spent_today
+        capital_used = self.state.spent_today
         capital_remaining = max(capital_allowed - capital_used, 0.0)
         min_trade = self.config.min_trade_usdt
 
@@ -1307,12 +1274,14 @@ class Bot(Thread):
         if total_usdt <= 0:
             return 0.0
 
-        capital_for_bot = total_usdt * self.config.capital_pct
-        trade_usdt = capital_for_bot * self.config.trade_pct
+        cfg = self.config
+        min_trade = cfg.min_trade_usdt
+        capital_for_bot = total_usdt * cfg.capital_pct
+        trade_usdt = capital_for_bot * cfg.trade_pct
 
-        if trade_usdt < self.config.min_trade_usdt:
-            if capital_for_bot >= self.config.min_trade_usdt:
-                trade_usdt = self.config.min_trade_usdt
+        if trade_usdt < min_trade:
+            if capital_for_bot >= min_trade:
+                trade_usdt = min_trade
             else:
                 return 0.0
 
@@ -1332,6 +1301,8 @@ class Bot(Thread):
                 trailing_max_price=max_price,
                 trailing_enabled=True,
             )
+            # A position can be held for hours inside one cycle; keep readers current
+            self._publish_snapshot()
             if max_price is None:
                 return
             if last_saved_max["value"] is None or max_price > last_saved_max["value"]:
@@ -1358,7 +1329,7 @@ class Bot(Thread):
 
     def _on_sell(self, order: dict) -> None:
         received = float(order.get("cummulativeQuoteQty", 0.0))
-        profit = received - self.open_position_spent
+        profit = received - self.state.open_position_spent
 
         new_total = (self.state.total_pnl_usdt or 0.0) + profit
 
@@ -1393,7 +1364,7 @@ class Bot(Thread):
                 side="SELL",
                 price=avg_price,
                 qty=exec_qty,
-                usdt_spent=self.open_position_spent,
+                usdt_spent=self.state.open_position_spent,
                 usdt_received=received,
                 trade_pnl=profit,
             )
@@ -1406,13 +1377,13 @@ class Bot(Thread):
             try:
                 self.adaptive_controller.evaluate(self)
             except Exception as e:
-                logger.warning("Adaptive evaluation failed: %s", e)
+                logger.warning("Adaptive evaluation failed: {}", e)
         if self.reporter is not None:
             try:
                 auditor = PostMortemAuditor(self.reporter, self.adaptive_controller)
                 auditor.write_latest_summary(self.config.bot_id)
             except Exception as e:
-                logger.warning("Post-mortem audit failed: %s", e)
+                logger.warning("Post-mortem audit failed: {}", e)
         clear_state(self.config.symbol)
 
         if self.state.trading_mode == TradingMode.LIVE and self.state.real_capital_enabled:
@@ -1423,11 +1394,6 @@ class Bot(Thread):
                 self._set_state(real_drawdown_pct=drawdown_pct)
 
         # Reset position
-        self.open_position_spent = 0.0
-        self.armed = False
-        self.arm_price = None
-
-        # Reflect reset in UI state (optional but helps visuals)
         self._set_state(
             open_position_spent=0.0,
             armed=False,
@@ -1513,41 +1479,34 @@ class Bot(Thread):
                     exit_reason=exit_reason,
                 )
         except Exception as e:
-            logger.warning("DB trade persist failed: %s", e)
+            logger.warning("DB trade persist failed: {}", e)
 
     def _send_trade_alert(self, text: str, delete_after: int) -> None:
-        if self.notifier is None:
-            return
-
-        def _send():
-            try:
-                self.notifier.send_ephemeral_sync(
-                    text=text,
-                    delete_after=delete_after,
-                    silent=False,
-                )
-            except Exception as e:
-                logger.warning("Trade alert failed: %s", e)
-
-        Thread(target=_send, daemon=True).start()
+        self._notify(
+            text=text,
+            delete_after=delete_after,
+            silent=False,
+        )
 
     # =========================
     # Strategy helpers
     # =========================
     def _entry_signal(self) -> bool:
-        klines = self.market.get_klines(
-            self.config.symbol,
-            self.config.kline_interval,
-            self.config.kline_limit,
+        cfg = self.config
+        fast_n, slow_n = cfg.sma_fast, cfg.sma_slow
+        klines = self.market.get_kline_array(
+            cfg.symbol,
+            cfg.kline_interval,
+            cfg.kline_limit,
         )
 
-        closes = [float(k[4]) for k in klines]
-        if len(closes) < self.config.sma_slow:
+        closes = klines[:, CLOSE]
+        if len(closes) < slow_n:
             return False
 
-        fast = sum(closes[-self.config.sma_fast:]) / self.config.sma_fast
-        slow = sum(closes[-self.config.sma_slow:]) / self.config.sma_slow
-        current = closes[-1]
+        fast = float(closes[-fast_n:].mean())
+        slow = float(closes[-slow_n:].mean())
+        current = float(closes[-1])
 
         self._set_state(
             sma_fast=fast,
@@ -1603,7 +1562,7 @@ class Bot(Thread):
                 )
                 return True
         except Exception as e:
-            logger.warning("Decision log failed: %s", e)
+            logger.warning("Decision log failed: {}", e)
             return True
 
     def _log_no_trade_decision(self, *, reason: str, min_interval_seconds: float) -> None:
@@ -1631,7 +1590,7 @@ class Bot(Thread):
                     ai_blocked_by_ai=False,
                 )
         except Exception as e:
-            logger.warning("Decision log failed: %s", e)
+            logger.warning("Decision log failed: {}", e)
 
     def _get_cycle_regime(self, session, profile_id: int, asset_id: int) -> MarketRegime:
         if self._cycle_regime is not None:
@@ -1692,4 +1651,4 @@ class Bot(Thread):
         return datetime.now(tz=BOGOTA_TZ)
 
     def _day_key(self):
-        return self._now().strftime("%Y-%m-%d")
+        return self._now().date().isoformat()
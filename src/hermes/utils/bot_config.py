@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     # Identity
     bot_id: str
@@ -34,3 +34,8 @@ class BotConfig:
     trend_exit_enabled: bool = True
     trend_sma_period: int = 25
     max_hold_seconds_without_new_high: float = 300.0
+
+    def __post_init__(self):
+        # Providers use symbols as-is; normalize once, at construction
+        object.__setattr__(self, "symbol", self.symbol.upper())
+        object.__setattr__(self, "base_asset", self.base_asset.upper())
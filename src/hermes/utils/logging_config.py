@@ -1,17 +1,39 @@
 from loguru import logger
+import gzip
+import os
+import shutil
 import sys
+import threading
 from pathlib import Path
 
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
+
+def _gzip_in_place(path: str) -> None:
+    # No logger calls here: this runs while the file sink is rotating
+    with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.remove(path)
+
+
+def _compress_in_background(path: str) -> None:
+    """
+    Loguru compression hook: gzip the rotated file on a side thread so the
+    sink can reopen and keep writing immediately.
+    """
+    threading.Thread(
+        target=_gzip_in_place, args=(path,), name="log-compress", daemon=True
+    ).start()
+
 def setup_logging() -> None:
     """
     Configure Loguru for the application.
 
     - Console logs (INFO+)
     - File logs (DEBUG+)
-    - Automatic rotation and retention
+    - Automatic rotation and retention (gzip runs off the sink thread)
+    - File writes are queued off the calling thread
     """
 
     logger.remove()
@@ -31,6 +53,11 @@ def setup_logging() -> None:
         level="DEBUG",
         rotation="5 MB",
         retention="7 days",
-        compression="zip",
+        compression=_compress_in_background,
+        # Records are written (and rotated) by Loguru's background worker,
+        # so callers never block on disk I/O.
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
     )
\ No newline at end of file
@@ -1,10 +1,16 @@
 # hermes/utils/report_manager.py
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import csv
+import io
 
 from hermes.service.bot_state import BotRuntimeState
 
+# Single worker: report writes are serialized off the caller's thread
+_REPORT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+_MANAGER: "ReportManager | None" = None
+
 
 class ReportManager:
     def __init__(self, base_dir: str = "reports"):
@@ -27,27 +33,46 @@ class ReportManager:
         return self.bots_path / f"{symbol}_{timestamp}.csv"
 
 
-def write_bot_report(state: BotRuntimeState) -> str:
-    manager = ReportManager()
+def _get_manager() -> ReportManager:
+    # Directories are created once, on first use, instead of on every report
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = ReportManager()
+    return _MANAGER
+
+
+def write_bot_report(state: BotRuntimeState) -> Future[str]:
+    """
+    Snapshot the report rows now and write the CSV in the background.
+    The returned future resolves to the file path.
+    """
+    manager = _get_manager()
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     file_path = manager.get_bot_report_csv(state.symbol, timestamp)
 
-    with open(file_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["field", "value"])
-
-        writer.writerow(["symbol", state.symbol])
-        writer.writerow(["profile", state.profile])
-        writer.writerow(["running", state.running])
-        writer.writerow(["total_pnl_usdt", f"{state.total_pnl_usdt:.4f}"])
-        writer.writerow(["last_trade_profit_usdt", f"{state.last_trade_profit_usdt:.4f}"])
-        writer.writerow(["buys_today", state.buys_today])
-        writer.writerow(["spent_today", f"{state.spent_today:.2f}"])
-        writer.writerow(["last_action", state.last_action])
-        writer.writerow(["entry_price", state.entry_price])
-        writer.writerow(["arm_price", state.arm_price])
-        writer.writerow(["last_price", state.last_price])
-        writer.writerow(["updated_at", state.last_update])
+    rows = [
+        ("field", "value"),
+        ("symbol", state.symbol),
+        ("profile", state.profile),
+        ("running", state.running),
+        ("total_pnl_usdt", f"{state.total_pnl_usdt:.4f}"),
+        ("last_trade_profit_usdt", f"{state.last_trade_profit_usdt:.4f}"),
+        ("buys_today", state.buys_today),
+        ("spent_today", f"{state.spent_today:.2f}"),
+        ("last_action", state.last_action),
+        ("entry_price", state.entry_price),
+        ("arm_price", state.arm_price),
+        ("last_price", state.last_price),
+        ("updated_at", state.last_update),
+    ]
+
+    return _REPORT_POOL.submit(_flush_report, file_path, rows)
+
 
+def _flush_report(file_path: Path, rows: list[tuple]) -> str:
+    # Render in memory, then hand the file a single write
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    file_path.write_text(buf.getvalue(), newline="")
     return str(file_path)
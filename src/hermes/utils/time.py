@@ -0,0 +1,4 @@
+# src/utils/time.py
+from zoneinfo import ZoneInfo
+
+BOGOTA_TZ = ZoneInfo("America/Bogota")